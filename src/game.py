@@ -4,22 +4,36 @@
 Crack the code board game.
 """
 
-from random import shuffle
+from bisect import insort
+from collections import deque
+from random import sample
 
-from src.tiles import clue_factory, Colours, Tile
+from src.tiles import Query, QUERY_POOL, Tile, WHITE, BLACK, GREEN
+
+
+# The full set of packed tiles, built once as the contents never change.
+# The 2 number 5 tiles are green, the rest are white and black
+_MASTER_TILES = tuple(
+    i << 2 | (GREEN if i == 5 else c)
+    for i in range(10)
+    for c in (WHITE, BLACK)
+)
 
 
 class Player:
     """
     A player in the game.
+    Tiles are stored packed, one byte per tile, see Tile.packed.
     """
 
-    tiles: list[Tile]
+    __slots__ = ("tiles", "made_guess", "guessed_correctly")
+
+    tiles: bytes
     made_guess: bool
     guessed_correctly: bool
 
-    def __init__(self, tiles: list[Tile] = []):
-        self.tiles = tiles
+    def __init__(self, tiles: bytes | None = None):
+        self.tiles = b"" if tiles is None else tiles
         self.made_guess = False
         self.guessed_correctly = False
 
@@ -33,18 +47,23 @@ class Game:
     The players must ask and answer questions to figure out what numbers the
     other players have taken, and then deduce the remaining numbers to win the
     game.
+
+    The solution and player tiles are held as bytes of packed tiles (see
+    Tile.packed) so they sort as plain ints and compare as bytes.
     """
 
     players: dict[str]
-    solution: list[Tile]
-    backlog_queries: list[str]
-    current_queries: list[str]
+    solution: bytes
+    backlog_queries: deque[Query]
+    current_queries: list[Query]
+    _winners: list[str]
 
     def __init__(self):
         self.players = {}
-        self.solution = []
-        self.backlog_queries = []
+        self.solution = b""
+        self.backlog_queries = deque()
         self.current_queries = []
+        self._winners = []
 
     def new_game(self, num_players: int) -> list[str]:
         """
@@ -68,10 +87,11 @@ class Game:
         """
 
         # Wipe any existing state
-        self.solution = []
+        self.solution = b""
         self.players = {}
-        self.backlog_queries = []
+        self.backlog_queries = deque()
         self.current_queries = []
+        self._winners = []
 
         # Sanity checks
         if num_players < 2 or num_players > 4:
@@ -84,45 +104,29 @@ class Game:
             )
 
         # Load the clues
-        self.backlog_queries = clue_factory()
-        shuffle(self.backlog_queries)
+        self.backlog_queries = deque(
+            sample(QUERY_POOL, len(QUERY_POOL))
+        )
+        popleft = self.backlog_queries.popleft
         self.current_queries = [
-            self.backlog_queries.pop(0)
+            popleft()
             for _ in range(min(6, len(self.backlog_queries)))
         ]
 
-        # Enumerate the tiles
-        game_tiles = []
-        for i in range(10):
-            # The 2 number 5 tiles are green, the rest are white and black
-            if i != 5:
-                tile_pair = [
-                    Tile(i, Colours.WHITE),
-                    Tile(i, Colours.BLACK)
-                ]
-            else:
-                tile_pair = [
-                    Tile(i, Colours.GREEN),
-                    Tile(i, Colours.GREEN)
-                ]
-
-            game_tiles.extend(tile_pair)
-
-        # Shuffle tiles and split into player sets
+        # Draw random tiles and split into player sets
+        # Only the tiles in play are drawn, the master set is never modified
         # 2 players = 5 tiles
         # 3 players = 5 tiles
         # 4 players = 4 tiles
-        shuffle(game_tiles)
         num_tiles_pp = 5 if num_players < 4 else 4
+        game_tiles = sample(_MASTER_TILES, (num_players + 1) * num_tiles_pp)
         split_tiles = [
             game_tiles[i*num_tiles_pp:(i+1)*num_tiles_pp]
             for i in range(num_players + 1)
         ]
-        self.solution = sorted(split_tiles.pop(0), key=Tile.sorting_func)
+        self.solution = bytes(sorted(split_tiles.pop(0)))
         for i, tiles in enumerate(split_tiles):
-            self.players[f"token{i}"] = Player(
-                sorted(tiles, key=Tile.sorting_func)
-            )
+            self.players[f"token{i}"] = Player(bytes(sorted(tiles)))
 
         # Return player IDs
         return list(self.players.keys())
@@ -142,19 +146,26 @@ class Game:
         """
 
         # Sanity checks
-        if player_id not in self.players:
+        player = self.players.get(player_id)
+        if player is None:
             raise ValueError("Player ID is invalid")
 
         # Return character tiles
-        return self.players[player_id].tiles
+        return [Tile.from_packed(t) for t in player.tiles]
 
-    def submit_solution(self, player_id: str, submission: list[Tile]) -> None:
+    def submit_solution(
+        self,
+        player_id: str,
+        submission: list[Tile] | bytes,
+    ) -> None:
         """
         Attempt to submit a solution to the game.
         NOTE: The order must be provided correctly too.
 
         Args:
-            submission (list[int]): The submission of tiles.
+            submission (list[Tile] | bytes): The submission of tiles, either
+                as tiles or already packed. Anything else is recorded as a
+                wrong guess.
 
         Raises:
             ValueError: If the player ID is invalid.
@@ -162,30 +173,41 @@ class Game:
         """
 
         # Sanity checks
-        if player_id not in self.players:
+        player = self.players.get(player_id)
+        if player is None:
             raise ValueError("Player ID is invalid")
-        if self.players[player_id].made_guess:
+        if player.made_guess:
             raise ValueError("Player has already submitted a guess")
 
+        # Pack the submission before recording the guess
+        # Anything which isn't a list of tiles can never match the solution
+        packed: bytes | None
+        if isinstance(submission, bytes):
+            packed = submission
+        else:
+            try:
+                packed = bytes([t.packed for t in submission])
+            except (AttributeError, TypeError):
+                packed = None
+
         # Check the submission
         # Trivial check as tiles always in order
-        self.players[player_id].made_guess = True
-        if submission == self.solution:
-            self.players[player_id].guessed_correctly = True
+        player.made_guess = True
+        if packed == self.solution:
+            player.guessed_correctly = True
+            # Keep the winners in player order as they come in
+            insort(self._winners, player_id, key=list(self.players).index)
 
     def get_winners(self) -> list[str]:
         """
         Get the winners of the game.
 
         Returns:
-            list[str]: The unique IDs of the winners.
+            list[str]: The unique IDs of the winners, in player order.
         """
 
-        return [
-            player_id
-            for player_id, player in self.players.items()
-            if player.guessed_correctly
-        ]
+        # Winners are recorded, in player order, as they submit
+        return list(self._winners)
 
     def expend_query(self, idx: int) -> None:
         """
@@ -199,11 +221,12 @@ class Game:
         """
 
         # Sanity checks
-        if idx < 0 or idx >= len(self.current_queries):
+        queries = self.current_queries
+        if idx < 0 or idx >= len(queries):
             raise ValueError("Index is invalid")
 
         # Replace the clue
-        if len(self.backlog_queries) > 0:
-            self.current_queries[idx] = self.backlog_queries.pop(0)
+        if self.backlog_queries:
+            queries[idx] = self.backlog_queries.popleft()
         else:
-            self.current_queries.pop(idx)
+            queries.pop(idx)
@@ -2,6 +2,8 @@
 
 from typing import Any, Callable
 from enum import Enum
+from functools import cached_property
+from operator import attrgetter
 
 
 class Colours(Enum):
@@ -10,51 +12,310 @@ class Colours(Enum):
     GREEN = "green"
 
 
+# Integer colour codes used for packed tiles
+# Packed tiles are (number << 2) | colour, which orders the same as
+# Tile.sorting_func so packed tiles can be sorted directly
+WHITE, BLACK, GREEN = 0, 1, 2
+_COLOUR_CODES = {
+    Colours.WHITE: WHITE,
+    Colours.BLACK: BLACK,
+    Colours.GREEN: GREEN,
+}
+_CODE_COLOURS = (Colours.WHITE, Colours.BLACK, Colours.GREEN)
+
+
 class Tile:
     """
     A tile in the game.
+    The colour is held as its int code (WHITE, BLACK or GREEN), Colours is
+    only used to validate the colour given when creating the tile.
+    The tile is also packed into a single int, (number << 2) | colour code.
     """
 
+    __slots__ = ("number", "colour", "packed")
+
     number: int
-    colour: Colours
+    colour: int
+    packed: int
 
     def __init__(self, number: int, colour: Colours | str):
         # Sanity checks
+        if not isinstance(number, int):
+            raise ValueError("Number must be an int")
         if number < 0 or number > 9:
             raise ValueError("Number must be between 0 and 9 inclusive")
+        # Colours() raises a ValueError for an unknown colour string
         if isinstance(colour, str):
             colour = Colours(colour)
-        if colour not in [Colours.WHITE, Colours.BLACK, Colours.GREEN]:
+        if not isinstance(colour, Colours):
             raise ValueError("Colour must be white, black or green")
 
         self.number = number
-        self.colour = colour
+        self.colour = _COLOUR_CODES[colour]
+        self.packed = number << 2 | self.colour
 
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, Tile):
             return False
 
-        return self.number == __value.number and self.colour == __value.colour
+        return self.packed == __value.packed
 
     def __repr__(self) -> str:
-        return f"Tile({self.number}, {self.colour})"
+        return f"Tile({self.number}, {_CODE_COLOURS[self.colour]})"
 
     @staticmethod
-    def sorting_func(t: 'Tile') -> int:
+    def from_packed(t: int) -> 'Tile':
         """
-        Sorting function for tiles.
-        Tiles should be ordered lowest to highest, with White tiles before
-        black tiles.
+        Create a tile from its packed int form.
+
+        Args:
+            t (int): The packed tile, as returned by Tile.packed.
 
         Returns:
-            str: A unique value for the tile.
+            Tile: The unpacked tile.
         """
 
-        res = t.number * 10
-        if t.colour == Colours.BLACK:
-            res += 1
+        return Tile(t >> 2, _CODE_COLOURS[t & 3])
+
+    # Sorting function for tiles.
+    # Tiles should be ordered lowest to highest, with White tiles before
+    # black tiles, which is the order of the packed tiles. attrgetter keeps
+    # the key lookup in C rather than calling a Python function per tile.
+    sorting_func = attrgetter("packed")
+
+
+# Lookup tables splitting a packed tile into its number and colour code
+_NUMBER_TABLE = bytes(t >> 2 for t in range(256))
+_COLOUR_TABLE = bytes(t & 3 for t in range(256))
+
+# Membership tables for the fixed number features, indexed by packed tile
+_EVEN_TABLE = bytes(t >> 2 & 1 == 0 for t in range(256))
+_GT5_TABLE = bytes(t >> 2 > 5 for t in range(256))
+_LT5_TABLE = bytes(t >> 2 < 5 for t in range(256))
+
+# The longest row TileArray.lane_sum can add up within one 8 bit lane
+MAX_LANE_SUM_TILES = 28
 
-        return res
+
+class TileArray:
+    """
+    A row of tiles stored as a struct of arrays.
+    The numbers and colour codes are held in parallel bytes, so the queries
+    can work on whole columns instead of looking up attributes per tile.
+
+    The packed tiles are also held as a single int board with one 8 bit lane
+    per tile (tile i in bits 8i to 8i+7), so some queries can be answered
+    with a few bitwise operations on the whole row at once. The numbers
+    column is held the same way, for the lane sums and sequential checks.
+    """
+
+    __slots__ = (
+        "packed", "numbers", "colours", "board", "number_board", "ones",
+        "guards",
+    )
+
+    packed: bytes
+    numbers: bytes
+    colours: bytes
+    board: int
+    number_board: int
+    ones: int
+    guards: int
+
+    def __init__(self, packed: bytes):
+        """
+        args:
+            packed (bytes): The tiles in order, packed as per Tile.packed.
+        """
+        self.packed = packed
+        self.numbers = packed.translate(_NUMBER_TABLE)
+        self.colours = packed.translate(_COLOUR_TABLE)
+        self.board = int.from_bytes(packed, "little")
+        self.number_board = int.from_bytes(self.numbers, "little")
+        # The low and high bit of every lane in use
+        self.ones = int.from_bytes(b"\x01" * len(packed), "little")
+        self.guards = self.ones << 7
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def sorted_indices(self) -> list[int]:
+        """
+        Find the order which sorts the tiles as per Tile.sorting_func.
+        The packed tiles are already that sort key, so no per tile key
+        function is needed.
+
+        returns:
+            list[int]: The indices of the tiles in sorted order, ties kept
+                in their original order.
+        """
+
+        return sorted(range(len(self)), key=self.packed.__getitem__)
+
+    def colour_lanes(self, colour: int) -> int:
+        """
+        Find the tiles of a colour.
+
+        args:
+            colour (int): The colour code to match.
+
+        returns:
+            int: The low bit of each lane holding a tile of the colour.
+        """
+
+        # A lane matches when its 2 colour bits are zero after the xor
+        x = self.board ^ colour * self.ones
+        return ~(x | x >> 1) & self.ones
+
+    def table_lanes(self, table: bytes) -> int:
+        """
+        Find the tiles which are members of a lookup table.
+
+        args:
+            table (bytes): 1 for each packed tile value in the set, otherwise
+                0, indexed by packed tile.
+
+        returns:
+            int: The low bit of each lane holding a tile in the set.
+        """
+
+        # The 0 / 1 byte per tile is already the lane mask
+        return int.from_bytes(self.packed.translate(table), "little")
+
+    def lane_sum(self, lanes: int) -> int:
+        """
+        Sum the numbers of the tiles in the given lanes.
+        Lane sums are held in 8 bits, so rows may hold at most
+        MAX_LANE_SUM_TILES tiles (9 * 28 = 252 still fits in a lane).
+
+        args:
+            lanes (int): The low bit of each lane to sum, as returned by
+                colour_lanes.
+
+        returns:
+            int: The sum of the numbers in the lanes.
+
+        raises:
+            ValueError: If the row is too long for the sum to fit in a lane.
+        """
+
+        # Sanity checks
+        if len(self) > MAX_LANE_SUM_TILES:
+            raise ValueError(
+                f"Lane sums support at most {MAX_LANE_SUM_TILES} tiles"
+            )
+
+        if not lanes:
+            return 0
+
+        # Multiplying by the lane ones adds every lane into the top lane
+        numbers = self.number_board & lanes * 0xF
+        return numbers * self.ones >> 8 * (len(self) - 1) & 0xFF
+
+    def same_colour_pairs(self) -> int:
+        """
+        Compare the colours of each pair of adjacent tiles.
+
+        returns:
+            int: The low bit of lane i set if tiles i and i + 1 are the same
+                colour.
+        """
+
+        # Lane i compares tile i with tile i + 1
+        x = self.board ^ self.board >> 8
+        return ~(x | x >> 1) & self.ones >> 8
+
+    def sequential_pairs(self) -> int:
+        """
+        Check if each pair of adjacent tiles are sequential numbers.
+
+        returns:
+            int: The low bit of lane i set if tile i + 1 is one more than
+                tile i.
+        """
+
+        # Lane i holds 0x80 + n[i + 1] - n[i], the guard bit stops any borrow
+        # into the next lane, so sequential pairs are exactly the 0x81 lanes
+        diff = (self.number_board >> 8 | self.guards) - self.number_board
+        x = diff ^ self.ones * 0x81
+
+        # Zero lane test, bit 7 of a lane is left set only if the lane is 0
+        low = self.ones * 0x7F
+        zero = ~((x & low) + low | x) >> 7 & self.ones
+        return zero & self.ones >> 8
+
+    def lane_indices(self, lanes: int) -> list[int]:
+        """
+        Convert a lane mask into tile indices.
+
+        args:
+            lanes (int): The low bit of each lane to convert.
+
+        returns:
+            list[int]: The indices of the lanes, in ascending order.
+        """
+
+        return [
+            i
+            for i, hit in enumerate(lanes.to_bytes(len(self), "little"))
+            if hit
+        ]
+
+    @staticmethod
+    def from_tiles(tiles: list[Tile]) -> 'TileArray':
+        """
+        Create a tile array from a list of tiles.
+
+        args:
+            tiles (list[Tile]): The tiles in order.
+
+        returns:
+            TileArray: The tiles as a struct of arrays.
+        """
+
+        return TileArray(bytes([t.packed for t in tiles]))
+
+
+class TileEvaluator:
+    """
+    Evaluates the queries for one row of tiles.
+    The lane masks shared between queries are worked out the first time they
+    are needed and reused after that, so e.g. the white tiles are only
+    found once for both the white sum and the white count.
+    """
+
+    ta: TileArray
+
+    def __init__(self, ta: TileArray):
+        """
+        args:
+            ta (TileArray): The tiles to evaluate the queries for.
+        """
+        self.ta = ta
+
+    @cached_property
+    def white_mask(self) -> int:
+        return self.ta.colour_lanes(WHITE)
+
+    @cached_property
+    def black_mask(self) -> int:
+        return self.ta.colour_lanes(BLACK)
+
+    @cached_property
+    def green_mask(self) -> int:
+        return self.ta.colour_lanes(GREEN)
+
+    @cached_property
+    def even_mask(self) -> int:
+        return self.ta.table_lanes(_EVEN_TABLE)
+
+    @cached_property
+    def gt5_mask(self) -> int:
+        return self.ta.table_lanes(_GT5_TABLE)
+
+    @cached_property
+    def lt5_mask(self) -> int:
+        return self.ta.table_lanes(_LT5_TABLE)
 
 
 class Query:
@@ -66,13 +327,21 @@ class Query:
     def __repr__(self) -> str:
         return self.description
 
-    def answer(self, tiles: list[Tile]) -> Any:
+    def answer(self, tiles: TileArray) -> Any:
         """
         NOTE: This method is only here to allow for a "computer" player.
         A major part of the game is to have the player figure out the answer
         to the query questions themselves.
         """
 
+        return self.evaluate(TileEvaluator(tiles))
+
+    def evaluate(self, ev: TileEvaluator) -> Any:
+        """
+        Answer the query using an evaluator, which may be shared with other
+        queries for the same tiles.
+        """
+
         raise NotImplementedError(
             "This method must be implemented by the subclass"
         )
@@ -86,22 +355,22 @@ class SumQuery(Query):
     def __init__(
         self,
         location: str,
-        subset_func: Callable[[list[Tile]], list[Tile]],
+        sum_func: Callable[[TileEvaluator], int],
     ):
         """
         A query that asks for the sum of the numbers on the tiles.
 
         args:
             location (str): The description of the location of the tiles.
-            subset_func (function): A function which returns the subset of
-                tiles to sum.
+            sum_func (function): A function which sums the numbers of the
+                subset of tiles.
         """
         super().__init__(
             f"What is the sum of the {location} tiles?"
         )
-        self.subset_func = subset_func
+        self.sum_func = sum_func
 
-    def answer(self, tiles: list[Tile]) -> int:
+    def evaluate(self, ev: TileEvaluator) -> int:
         """
         Answer the sum of the numbers on the tiles.
 
@@ -109,10 +378,7 @@ class SumQuery(Query):
             int: The sum of the numbers on the tiles.
         """
 
-        return sum([
-            t.number
-            for t in self.subset_func(tiles)
-        ])
+        return self.sum_func(ev)
 
 
 class CountQuery(Query):
@@ -123,22 +389,22 @@ class CountQuery(Query):
     def __init__(
         self,
         feature: str,
-        truthy_func: Callable[[Tile], bool],
+        count_func: Callable[[TileEvaluator], int],
     ):
         """
         A query that asks for the count of the tiles.
 
         args:
             feature (str): The description of the feature of the tiles.
-            subset_func (function): A function which determines if a tile has
+            count_func (function): A function which counts the tiles with
                 the feature.
         """
         super().__init__(
             f"How many {feature} tiles are there?"
         )
-        self.truthy_func = truthy_func
+        self.count_func = count_func
 
-    def answer(self, tiles: list[Tile]) -> int:
+    def evaluate(self, ev: TileEvaluator) -> int:
         """
         Answer the count of the tiles.
 
@@ -146,10 +412,7 @@ class CountQuery(Query):
             int: The number of tiles which match the feature.
         """
 
-        return [
-            self.truthy_func(t)
-            for t in tiles
-        ].count(True)
+        return self.count_func(ev)
 
 
 class AdjacencyQuery(Query):
@@ -160,22 +423,22 @@ class AdjacencyQuery(Query):
     def __init__(
         self,
         feature: str,
-        truthy_func: Callable[[Tile, Tile], bool],
+        pairs_func: Callable[[TileEvaluator], int],
     ):
         """
         A query that asks which adjacent tiles are related in some way.
 
         args:
             feature (str): The description of the feature of the tiles.
-            subset_func (function): A function which determines if two
-                adjacent tiles are related.
+            pairs_func (function): A function which returns a lane mask with
+                lane i set if tiles i and i + 1 are related.
         """
         super().__init__(
             f"Which adjacent tiles are {feature}?"
         )
-        self.truthy_func = truthy_func
+        self.pairs_func = pairs_func
 
-    def answer(self, tiles: list[Tile]) -> list[int]:
+    def evaluate(self, ev: TileEvaluator) -> list[int]:
         """
         Answer which adjacent tiles are related.
 
@@ -184,13 +447,85 @@ class AdjacencyQuery(Query):
                 related.
         """
 
-        ret = set()
-        for i in range(len(tiles) - 1):
-            if self.truthy_func(tiles[i], tiles[i + 1]):
-                ret.add(i)
-                ret.add(i + 1)
+        # Both tiles of each related pair, pair i covers lanes i and i + 1
+        pairs = self.pairs_func(ev)
+        return ev.ta.lane_indices(pairs | pairs << 8)
+
+
+# Kernels for the queries, registered by feature.
+# Each is specialised to its one feature up front rather than closing over
+# parameters, and works on a whole row of tiles at once.
+def _sum_white(ev: TileEvaluator) -> int:
+    return ev.ta.lane_sum(ev.white_mask)
+
+
+def _sum_black(ev: TileEvaluator) -> int:
+    return ev.ta.lane_sum(ev.black_mask)
+
+
+def _sum_green(ev: TileEvaluator) -> int:
+    return ev.ta.lane_sum(ev.green_mask)
+
+
+def _sum_right(ev: TileEvaluator) -> int:
+    return sum(ev.ta.numbers[-3:])
+
 
-        return list(ret)
+def _sum_left(ev: TileEvaluator) -> int:
+    return sum(ev.ta.numbers[:3])
+
+
+def _count_even(ev: TileEvaluator) -> int:
+    return ev.even_mask.bit_count()
+
+
+def _count_odd(ev: TileEvaluator) -> int:
+    return len(ev.ta) - ev.even_mask.bit_count()
+
+
+def _count_white(ev: TileEvaluator) -> int:
+    return ev.white_mask.bit_count()
+
+
+def _count_black(ev: TileEvaluator) -> int:
+    return ev.black_mask.bit_count()
+
+
+def _count_gt5(ev: TileEvaluator) -> int:
+    return ev.gt5_mask.bit_count()
+
+
+def _count_lt5(ev: TileEvaluator) -> int:
+    return ev.lt5_mask.bit_count()
+
+
+def _adj_same_colour(ev: TileEvaluator) -> int:
+    return ev.ta.same_colour_pairs()
+
+
+def _adj_sequential(ev: TileEvaluator) -> int:
+    return ev.ta.sequential_pairs()
+
+
+_SUM_KERNELS: dict[str, Callable[[TileEvaluator], int]] = {
+    "white": _sum_white,
+    "black": _sum_black,
+    "green": _sum_green,
+    "right": _sum_right,
+    "left": _sum_left,
+}
+_COUNT_KERNELS: dict[str, Callable[[TileEvaluator], int]] = {
+    "even": _count_even,
+    "odd": _count_odd,
+    "white": _count_white,
+    "black": _count_black,
+    "greater than 5": _count_gt5,
+    "less than 5": _count_lt5,
+}
+_ADJACENCY_KERNELS: dict[str, Callable[[TileEvaluator], int]] = {
+    "the same colour": _adj_same_colour,
+    "sequential": _adj_sequential,
+}
 
 
 def clue_factory() -> list[Query]:
@@ -202,64 +537,44 @@ def clue_factory() -> list[Query]:
         list[Query]: The queries for the game.
     """
 
+    # Sum Queries
     queries = [
-        # Sum Queries
-        SumQuery(
-            "white",
-            lambda tiles: [t for t in tiles if t.colour == Colours.WHITE]
-        ),
-        SumQuery(
-            "black",
-            lambda tiles: [t for t in tiles if t.colour == Colours.BLACK]
-        ),
-        SumQuery(
-            "green",
-            lambda tiles: [t for t in tiles if t.colour == Colours.GREEN]
-        ),
-        SumQuery(
-            "right",
-            lambda tiles: reversed(tiles[-1:-4:-1])
-        ),
-        SumQuery(
-            "left",
-            lambda tiles: tiles[:3]
-        ),
-
-        # Count Queries
-        CountQuery(
-            "even",
-            lambda t: t.number % 2 == 0
-        ),
-        CountQuery(
-            "odd",
-            lambda t: t.number % 2 == 1
-        ),
-        CountQuery(
-            "white",
-            lambda t: t.colour == Colours.WHITE
-        ),
-        CountQuery(
-            "black",
-            lambda t: t.colour == Colours.BLACK
-        ),
-        CountQuery(
-            "greater than 5",
-            lambda t: t.number > 5
-        ),
-        CountQuery(
-            "less than 5",
-            lambda t: t.number < 5
-        ),
-
-        # Adjacency Queries
-        AdjacencyQuery(
-            "the same colour",
-            lambda t1, t2: t1.colour == t2.colour
-        ),
-        AdjacencyQuery(
-            "sequential",
-            lambda t1, t2: t1.number + 1 == t2.number
-        )
+        SumQuery(location, kernel)
+        for location, kernel in _SUM_KERNELS.items()
+    ]
+
+    # Count Queries
+    queries += [
+        CountQuery(feature, kernel)
+        for feature, kernel in _COUNT_KERNELS.items()
+    ]
+
+    # Adjacency Queries
+    queries += [
+        AdjacencyQuery(feature, kernel)
+        for feature, kernel in _ADJACENCY_KERNELS.items()
     ]
 
     return queries
+
+
+# The queries hold no per-game state, so one pool is shared by every game
+QUERY_POOL: tuple[Query, ...] = tuple(clue_factory())
+
+
+def answer_all(ta: TileArray) -> dict[str, Any]:
+    """
+    Answer every query from clue_factory for a row of tiles in one go.
+    All of the queries share one evaluator, so the lane masks they have in
+    common are only worked out once.
+
+    args:
+        ta (TileArray): The tiles to answer the queries for.
+
+    returns:
+        dict[str, Any]: The answer to each query, keyed by its description.
+    """
+
+    ev = TileEvaluator(ta)
+    return {q.description: q.evaluate(ev) for q in QUERY_POOL}
+
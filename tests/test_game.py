@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""
+Checks the game state and rules.
+"""
+
+import unittest
+
+from src.game import _MASTER_TILES, Game, Player
+from src.tiles import QUERY_POOL, Tile
+
+
+class TestPlayer(unittest.TestCase):
+
+    def test_default_tiles(self):
+        player = Player()
+        self.assertEqual(player.tiles, b"")
+        self.assertFalse(player.made_guess)
+        self.assertFalse(player.guessed_correctly)
+
+
+class TestGame(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.player_ids = self.game.new_game(4)
+
+    def test_deal(self):
+        self.assertEqual(
+            self.player_ids,
+            ["token0", "token1", "token2", "token3"],
+        )
+        self.assertIsInstance(self.game.solution, bytes)
+        self.assertEqual(len(self.game.solution), 4)
+
+        # No tile is dealt more often than it appears in the deck
+        dealt = list(self.game.solution)
+        for player_id in self.player_ids:
+            tiles = self.game.get_character_tiles(player_id)
+            self.assertIsInstance(self.game.players[player_id].tiles, bytes)
+            self.assertEqual(len(tiles), 4)
+            self.assertEqual(tiles, sorted(tiles, key=Tile.sorting_func))
+            self.assertEqual(
+                [t.packed for t in tiles],
+                list(self.game.players[player_id].tiles),
+            )
+            dealt.extend(t.packed for t in tiles)
+        for t in dealt:
+            self.assertLessEqual(dealt.count(t), _MASTER_TILES.count(t))
+
+    def test_invalid_player(self):
+        with self.assertRaises(ValueError):
+            self.game.get_character_tiles("token9")
+        with self.assertRaises(ValueError):
+            self.game.submit_solution("token9", [])
+
+    def test_tile_submission_wins(self):
+        solution = [Tile.from_packed(t) for t in self.game.solution]
+        self.game.submit_solution("token0", solution)
+        self.assertTrue(self.game.players["token0"].guessed_correctly)
+        self.assertEqual(self.game.get_winners(), ["token0"])
+
+    def test_bytes_submission_wins(self):
+        self.game.submit_solution("token1", bytes(self.game.solution))
+        self.assertEqual(self.game.get_winners(), ["token1"])
+
+    def test_wrong_submissions(self):
+        solution = [Tile.from_packed(t) for t in self.game.solution]
+        submissions = {
+            "token0": solution[::-1],
+            "token1": [1, 2, 3, 4],
+            "token2": None,
+            "token3": b"",
+        }
+        for player_id, submission in submissions.items():
+            with self.subTest(submission=submission):
+                self.game.submit_solution(player_id, submission)
+                player = self.game.players[player_id]
+                self.assertTrue(player.made_guess)
+                self.assertFalse(player.guessed_correctly)
+        self.assertEqual(self.game.get_winners(), [])
+
+    def test_second_guess_raises(self):
+        self.game.submit_solution("token2", None)
+        with self.assertRaises(ValueError):
+            self.game.submit_solution("token2", self.game.solution)
+        self.assertEqual(self.game.get_winners(), [])
+
+    def test_winners_in_player_order(self):
+        for player_id in ("token3", "token0", "token2"):
+            self.game.submit_solution(player_id, self.game.solution)
+        self.assertEqual(
+            self.game.get_winners(),
+            ["token0", "token2", "token3"],
+        )
+
+    def test_new_game_resets_winners(self):
+        self.game.submit_solution("token0", self.game.solution)
+        self.game.new_game(3)
+        self.assertEqual(self.game.get_winners(), [])
+
+    def test_expend_query(self):
+        current = self.game.current_queries
+        self.assertEqual(len(current), 6)
+        self.assertEqual(len(self.game.backlog_queries), len(QUERY_POOL) - 6)
+        self.assertEqual(
+            set(current) | set(self.game.backlog_queries),
+            set(QUERY_POOL),
+        )
+
+        # Expended queries are replaced until the backlog is drained
+        while self.game.backlog_queries:
+            self.game.expend_query(0)
+            self.assertEqual(len(current), 6)
+
+        # Then the current queries shrink instead
+        for remaining in range(5, -1, -1):
+            self.game.expend_query(remaining // 2)
+            self.assertEqual(len(current), remaining)
+
+        with self.assertRaises(ValueError):
+            self.game.expend_query(0)
+
+    def test_expend_query_invalid_index(self):
+        with self.assertRaises(ValueError):
+            self.game.expend_query(-1)
+        with self.assertRaises(ValueError):
+            self.game.expend_query(6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""
+Checks the query answers against their straightforward definitions.
+"""
+
+import random
+import unittest
+
+from src.tiles import (
+    answer_all,
+    BLACK,
+    clue_factory,
+    Colours,
+    GREEN,
+    MAX_LANE_SUM_TILES,
+    Tile,
+    TileArray,
+    WHITE,
+)
+
+
+def related(tiles: list[Tile], truthy_func) -> list[int]:
+    """
+    The indices of the tiles in related adjacent pairs, the slow way.
+    """
+
+    ret = set()
+    for i in range(len(tiles) - 1):
+        if truthy_func(tiles[i], tiles[i + 1]):
+            ret.add(i)
+            ret.add(i + 1)
+
+    return sorted(ret)
+
+
+# The expected answer for each query, written as plain loops over tiles
+EXPECTED = {
+    "What is the sum of the white tiles?":
+        lambda ts: sum(t.number for t in ts if t.colour == WHITE),
+    "What is the sum of the black tiles?":
+        lambda ts: sum(t.number for t in ts if t.colour == BLACK),
+    "What is the sum of the green tiles?":
+        lambda ts: sum(t.number for t in ts if t.colour == GREEN),
+    "What is the sum of the right tiles?":
+        lambda ts: sum(t.number for t in ts[-3:]),
+    "What is the sum of the left tiles?":
+        lambda ts: sum(t.number for t in ts[:3]),
+    "How many even tiles are there?":
+        lambda ts: len([t for t in ts if t.number % 2 == 0]),
+    "How many odd tiles are there?":
+        lambda ts: len([t for t in ts if t.number % 2 == 1]),
+    "How many white tiles are there?":
+        lambda ts: len([t for t in ts if t.colour == WHITE]),
+    "How many black tiles are there?":
+        lambda ts: len([t for t in ts if t.colour == BLACK]),
+    "How many greater than 5 tiles are there?":
+        lambda ts: len([t for t in ts if t.number > 5]),
+    "How many less than 5 tiles are there?":
+        lambda ts: len([t for t in ts if t.number < 5]),
+    "Which adjacent tiles are the same colour?":
+        lambda ts: related(ts, lambda t1, t2: t1.colour == t2.colour),
+    "Which adjacent tiles are sequential?":
+        lambda ts: related(ts, lambda t1, t2: t1.number + 1 == t2.number),
+}
+
+
+def random_row(rng: random.Random, length: int) -> list[Tile]:
+    # Any number with any colour, repeats allowed
+    return [
+        Tile(rng.randrange(10), rng.choice(list(Colours)))
+        for _ in range(length)
+    ]
+
+
+class TestTile(unittest.TestCase):
+
+    def test_valid_tiles(self):
+        self.assertEqual(Tile(3, "black"), Tile(3, Colours.BLACK))
+        self.assertEqual(Tile(3, Colours.BLACK).colour, BLACK)
+
+    def test_invalid_numbers(self):
+        for number in (-1, 10, 3.0, None, "3"):
+            with self.subTest(number=number):
+                with self.assertRaises(ValueError):
+                    Tile(number, Colours.WHITE)
+
+    def test_invalid_colours(self):
+        # Int colour codes are not accepted, only Colours or their names
+        for colour in ("red", WHITE, 3, None, [1]):
+            with self.subTest(colour=colour):
+                with self.assertRaises(ValueError):
+                    Tile(1, colour)
+
+
+class TestQueries(unittest.TestCase):
+
+    def assert_answers(self, tiles: list[Tile]):
+        ta = TileArray.from_tiles(tiles)
+        answers = answer_all(ta)
+        for query in clue_factory():
+            expected = EXPECTED[query.description](tiles)
+            with self.subTest(query=query.description, tiles=tiles):
+                self.assertEqual(query.answer(ta), expected)
+                self.assertEqual(answers[query.description], expected)
+
+    def test_every_query_has_an_expectation(self):
+        self.assertEqual(
+            {q.description for q in clue_factory()},
+            set(EXPECTED),
+        )
+
+    def test_empty_row(self):
+        self.assert_answers([])
+
+    def test_single_tile(self):
+        for colour in Colours:
+            self.assert_answers([Tile(9, colour)])
+
+    def test_repeated_colours(self):
+        for colour in Colours:
+            self.assert_answers([Tile(n, colour) for n in range(10)])
+            self.assert_answers([Tile(9, colour)] * MAX_LANE_SUM_TILES)
+
+    def test_random_rows(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            length = rng.randint(0, MAX_LANE_SUM_TILES)
+            self.assert_answers(random_row(rng, length))
+
+    def test_lane_sum_rejects_long_rows(self):
+        ta = TileArray.from_tiles(
+            [Tile(9, Colours.WHITE)] * (MAX_LANE_SUM_TILES + 1)
+        )
+        with self.assertRaises(ValueError):
+            ta.lane_sum(ta.colour_lanes(WHITE))
+
+
+class TestSortedIndices(unittest.TestCase):
+
+    def assert_sorted(self, tiles: list[Tile]):
+        expected = sorted(
+            range(len(tiles)),
+            key=lambda i: Tile.sorting_func(tiles[i]),
+        )
+        with self.subTest(tiles=tiles):
+            self.assertEqual(
+                TileArray.from_tiles(tiles).sorted_indices(),
+                expected,
+            )
+
+    def test_short_rows(self):
+        self.assert_sorted([])
+        self.assert_sorted([Tile(4, Colours.BLACK)])
+
+    def test_ties_keep_their_order(self):
+        # Equal tiles must come out in their original order
+        self.assert_sorted([Tile(5, Colours.GREEN)] * 2)
+        self.assert_sorted([
+            Tile(7, Colours.BLACK),
+            Tile(2, Colours.WHITE),
+            Tile(7, Colours.BLACK),
+            Tile(2, Colours.WHITE),
+            Tile(7, Colours.WHITE),
+        ])
+
+    def test_random_rows(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            self.assert_sorted(random_row(rng, rng.randint(0, 20)))
+
+
+class TestSequentialPairs(unittest.TestCase):
+
+    def assert_pairs(self, numbers: list[int]):
+        ta = TileArray(bytes(n << 2 | BLACK for n in numbers))
+        expected = sum(
+            1 << 8 * i
+            for i in range(len(numbers) - 1)
+            if numbers[i] + 1 == numbers[i + 1]
+        )
+        with self.subTest(numbers=numbers):
+            self.assertEqual(ta.sequential_pairs(), expected)
+
+    def test_short_rows(self):
+        self.assert_pairs([])
+        self.assert_pairs([3])
+        self.assert_pairs([3, 4])
+
+    def test_borrows_stay_in_their_lane(self):
+        # Descending and wide gaps subtract below zero without the guard
+        self.assert_pairs([9, 0, 1, 0, 9, 8, 9])
+        self.assert_pairs([0, 9] * 10)
+        self.assert_pairs(list(range(10)) + list(range(9, -1, -1)))
+
+    def test_every_pair_of_numbers(self):
+        for a in range(10):
+            for b in range(10):
+                self.assert_pairs([a, b, a])
+
+    def test_long_rows(self):
+        # Unlike lane_sum there is no limit on the row length
+        rng = random.Random(0)
+        for _ in range(200):
+            self.assert_pairs([rng.randrange(10) for _ in range(64)])
+
+
+if __name__ == "__main__":
+    unittest.main()